@@ -97,6 +97,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: BedJetConfigEntry) -> bo
         name=f"{entry.title} ({entry.unique_id})",
         update_method=_async_update,
         update_interval=timedelta(seconds=UPDATE_SECONDS),
+        # state changes are pushed to entities via bedjet.register_callback, so
+        # only notify coordinator listeners when availability changes
+        always_update=False,
     )
 
     try:
@@ -87,3 +87,7 @@ class BedJetBinarySensorEntity(BedJetEntity, BinarySensorEntity):
     def _async_update_attrs(self) -> None:
         """Handle updating _attr values."""
         self._attr_is_on = self.entity_description.value_fn(self._device)
+
+    def _state_signature(self) -> tuple[Any, ...]:
+        """Return the values that make up the entity state."""
+        return (self._attr_is_on,)
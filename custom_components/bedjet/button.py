@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.const import EntityCategory
@@ -41,6 +42,10 @@ class BedJetButtonEntity(BedJetEntity, ButtonEntity):
         self._attr_unique_id = f"{device.address}_sync_clock"
         super().__init__(coordinator, device, name)
 
+    def _state_signature(self) -> tuple[Any, ...]:
+        """Return the values that make up the entity state."""
+        return ()
+
     async def async_press(self) -> None:
         """Handle the button press."""
         _now = now()
@@ -18,7 +18,7 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from . import BedJetConfigEntry
 from .entity import BedJetEntity
-from .pybedjet import BedJet, BedJetButton, BedJetCommand, OperatingMode
+from .pybedjet import BUTTON_COMMANDS, BedJet, BedJetButton, BedJetState, OperatingMode
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -60,6 +60,10 @@ PRESET_MODE_MAP = {
     # "Biorhythm 3": BedJetButton.BIORHYTHM_3,
 }
 
+# "None" is only used on V2 to revert from Turbo to Heat mode
+V2_PRESETS = tuple(preset for preset in PRESET_MODE_MAP if preset != "Extended Heat")
+V3_PRESETS = tuple(preset for preset in PRESET_MODE_MAP if preset != "None")
+
 MEMORY_PRESETS = (BedJetButton.M1, BedJetButton.M2, BedJetButton.M3)
 BIORHYTHM_PRESETS = (
     BedJetButton.BIORHYTHM_1,
@@ -67,6 +71,9 @@ BIORHYTHM_PRESETS = (
     BedJetButton.BIORHYTHM_3,
 )
 
+FAN_MODE_SPEEDS = {f"{speed}%": speed for speed in range(5, 101, 5)}
+FAN_SPEED_MODES = {speed: mode for mode, speed in FAN_MODE_SPEEDS.items()}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -83,7 +90,7 @@ async def async_setup_entry(
 class BedJetClimateEntity(BedJetEntity, ClimateEntity):
     """Representation of BedJet device."""
 
-    _attr_fan_modes = [f"{speed}%" for speed in (range(5, 101, 5))]
+    _attr_fan_modes = list(FAN_MODE_SPEEDS)
     _attr_name = None
     _attr_supported_features = (
         ClimateEntityFeature.TARGET_TEMPERATURE
@@ -108,56 +115,67 @@ class BedJetClimateEntity(BedJetEntity, ClimateEntity):
         if not device.is_v2:
             self._attr_hvac_modes.append(HVACMode.DRY)
 
+        self._static_presets = V2_PRESETS if device.is_v2 else V3_PRESETS
+        self._preset_names: tuple[str | None, ...] | None = None
+        self._named_presets: dict[str, BedJetButton] = {}
+        self._last_state: BedJetState | None = None
+
         super().__init__(coordinator, device, name)
 
     @callback
     def _async_update_attrs(self) -> None:
         """Handle updating _attr values."""
         device = self._device
+        names = (
+            device.m1_name,
+            device.m2_name,
+            device.m3_name,
+            device.biorhythm1_name,
+            device.biorhythm2_name,
+            device.biorhythm3_name,
+        )
+        if names != self._preset_names:
+            self._preset_names = names
+            self._attr_preset_modes = [*self._static_presets, *filter(None, names)]
+            named_presets: dict[str, BedJetButton] = {}
+            for name, button in zip(
+                names, MEMORY_PRESETS + BIORHYTHM_PRESETS, strict=True
+            ):
+                # the first preset with a given name wins
+                if name:
+                    named_presets.setdefault(name, button)
+            self._named_presets = named_presets
+
         state = device.state
+        if state == self._last_state:
+            return
+        self._last_state = state
+
         self._attr_current_temperature = state.current_temperature
-        self._attr_fan_mode = f"{state.fan_speed}%"
-        self._attr_hvac_mode = OPERATING_MODE_MAP[state.operating_mode]
+        self._attr_fan_mode = (
+            FAN_SPEED_MODES.get(state.fan_speed) or f"{state.fan_speed}%"
+        )
+        self._attr_hvac_mode = OPERATING_MODE_MAP.get(
+            state.operating_mode, HVACMode.OFF
+        )
         self._attr_max_temp = state.maximum_temperature
         self._attr_min_temp = state.minimum_temperature
 
-        # DYNAMIC V2 PRESETS: Filter out unsupported items
-        base_presets = list(PRESET_MODE_MAP.keys())
-        if device.is_v2:
-            if "Extended Heat" in base_presets:
-                base_presets.remove("Extended Heat")
-        else:
-            if "None" in base_presets:
-                base_presets.remove("None")
-
         self._attr_preset_mode = OPERATING_MODE_PRESET_MAP.get(state.operating_mode)
 
         # "None" included to revert from Turbo to Heat mode
         if device.is_v2 and self._attr_preset_mode is None:
             self._attr_preset_mode = "None"
 
-        self._attr_preset_modes = (
-            base_presets
-            + [
-                name
-                for name in (device.m1_name, device.m2_name, device.m3_name)
-                if name
-            ]
-            + [
-                name
-                for name in (
-                    device.biorhythm1_name,
-                    device.biorhythm2_name,
-                    device.biorhythm3_name,
-                )
-                if name
-            ]
-        )
         self._attr_target_temperature = state.target_temperature
 
+    def _state_signature(self) -> tuple[Any, ...]:
+        """Return the values that make up the entity state."""
+        return (self._last_state, self._preset_names)
+
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set new target fan mode."""
-        await self._device.set_fan_speed(int(fan_mode.replace("%", "")))
+        await self._device.set_fan_speed(FAN_MODE_SPEEDS[fan_mode])
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
@@ -184,23 +202,13 @@ class BedJetClimateEntity(BedJetEntity, ClimateEntity):
                     await device.set_operating_mode(OperatingMode.HEAT)
                 return
 
-        if not (button := PRESET_MODE_MAP.get(preset_mode)):
-            if preset_mode == device.m1_name:
-                button = BedJetButton.M1
-            elif preset_mode == device.m2_name:
-                button = BedJetButton.M2
-            elif preset_mode == device.m3_name:
-                button = BedJetButton.M3
-            elif preset_mode == device.biorhythm1_name:
-                button = BedJetButton.BIORHYTHM_1
-            elif preset_mode == device.biorhythm2_name:
-                button = BedJetButton.BIORHYTHM_2
-            elif preset_mode == device.biorhythm3_name:
-                button = BedJetButton.BIORHYTHM_3
-            else:
-                raise ValueError(f"{preset_mode} is not a valid preset for {self.name}")
-
-        await self._device._send_command(bytearray((BedJetCommand.BUTTON, button)))
+        if not (
+            button := PRESET_MODE_MAP.get(preset_mode)
+            or self._named_presets.get(preset_mode)
+        ):
+            raise ValueError(f"{preset_mode} is not a valid preset for {self.name}")
+
+        await self._device._send_command(BUTTON_COMMANDS[button])
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
@@ -49,6 +49,7 @@ class BedjetDeviceConfigFlow(ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         self._discovery_info: BluetoothServiceInfoBleak | None = None
         self._discovered_devices: dict[str, BluetoothServiceInfoBleak] = {}
+        self._data_schema: tuple[frozenset[str], vol.Schema] | None = None
 
     async def async_step_bluetooth(
         self, discovery_info: BluetoothServiceInfoBleak
@@ -58,11 +59,7 @@ class BedjetDeviceConfigFlow(ConfigFlow, domain=DOMAIN):
         await self.async_set_unique_id(discovery_info.address)
         self._abort_if_unique_id_configured()
 
-        success, name = await connect_bedjet(discovery_info.device)
-        if not success:
-            return self.async_abort(reason=name)
-
-        name = human_readable_name(name, discovery_info.name, discovery_info.address)
+        name = human_readable_name(None, discovery_info.name, discovery_info.address)
         self.context["title_placeholders"] = {"name": name}
         self._discovery_info = discovery_info
 
@@ -72,16 +69,26 @@ class BedjetDeviceConfigFlow(ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Confirm discovery."""
+        errors: dict[str, str] = {}
+
         if user_input is not None:
-            return self.async_create_entry(
-                title=self.context["title_placeholders"]["name"],
-                data={CONF_ADDRESS: self._discovery_info.address},
-            )
+            discovery_info = self._discovery_info
+            # only connect once the user wants to set up the discovered device
+            success, name = await connect_bedjet(discovery_info.device)
+            if success:
+                return self.async_create_entry(
+                    title=human_readable_name(
+                        name, discovery_info.name, discovery_info.address
+                    ),
+                    data={CONF_ADDRESS: discovery_info.address},
+                )
+            errors["base"] = name
 
         self._set_confirm_only()
         return self.async_show_form(
             step_id="bluetooth_confirm",
             description_placeholders=self.context["title_placeholders"],
+            errors=errors,
         )
 
     async def async_step_user(
@@ -125,20 +132,23 @@ class BedjetDeviceConfigFlow(ConfigFlow, domain=DOMAIN):
         if not self._discovered_devices:
             return self.async_abort(reason="no_devices_found")
 
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_ADDRESS): vol.In(
-                    {
-                        service_info.address: (
-                            f"{service_info.name} ({service_info.address})"
-                        )
-                        for service_info in self._discovered_devices.values()
-                    }
-                ),
-            }
-        )
+        addresses = frozenset(self._discovered_devices)
+        if self._data_schema is None or self._data_schema[0] != addresses:
+            data_schema = vol.Schema(
+                {
+                    vol.Required(CONF_ADDRESS): vol.In(
+                        {
+                            service_info.address: (
+                                f"{service_info.name} ({service_info.address})"
+                            )
+                            for service_info in self._discovered_devices.values()
+                        }
+                    ),
+                }
+            )
+            self._data_schema = (addresses, data_schema)
         return self.async_show_form(
             step_id="user",
-            data_schema=data_schema,
+            data_schema=self._data_schema[1],
             errors=errors,
         )
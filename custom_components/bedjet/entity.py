@@ -19,6 +19,7 @@ class BedJetEntity(CoordinatorEntity[DataUpdateCoordinator[None]]):
     """Representation of a BedJet device."""
 
     _attr_has_entity_name = True
+    _written_signature: tuple[Any, ...] | None = None
 
     def __init__(
         self, coordinator: DataUpdateCoordinator[None], device: BedJet, name: str
@@ -39,10 +40,22 @@ class BedJetEntity(CoordinatorEntity[DataUpdateCoordinator[None]]):
     def _async_update_attrs(self) -> None:
         """Handle updating _attr values."""
 
+    def _state_signature(self) -> tuple[Any, ...] | None:
+        """Return the values that make up the entity state.
+
+        Returning `None` means the state is always written on update.
+        """
+        return None
+
     @callback
     def _handle_coordinator_update(self, *args: Any) -> None:
         """Handle data update."""
         self._async_update_attrs()
+        if (signature := self._state_signature()) is not None:
+            signature = (self.available, *signature)
+            if signature == self._written_signature:
+                return
+            self._written_signature = signature
         self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
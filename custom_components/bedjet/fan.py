@@ -54,6 +54,10 @@ class BedJetFanEntity(BedJetEntity, FanEntity):
         self._attr_is_on = is_on
         self._attr_percentage = state.fan_speed if is_on else 0
 
+    def _state_signature(self) -> tuple[Any, ...]:
+        """Return the values that make up the entity state."""
+        return (self._attr_is_on, self._attr_percentage)
+
     async def async_set_percentage(self, percentage: int) -> None:
         """Set the speed of the fan, as a percentage."""
         if percentage == 0:
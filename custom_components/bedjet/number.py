@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 import logging
-from math import ceil
+from typing import Any
 
 from homeassistant.components.number import NumberDeviceClass, NumberEntity, NumberMode
 from homeassistant.const import UnitOfTime
@@ -17,6 +18,8 @@ from .pybedjet import BedJet
 
 _LOGGER = logging.getLogger(__name__)
 
+ONE_MINUTE = timedelta(minutes=1)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -52,8 +55,13 @@ class BedJetNumberEntity(BedJetEntity, NumberEntity):
         """Handle updating _attr values."""
         device = self._device
         state = device.state
-        self._attr_native_max_value = state.maximum_runtime.total_seconds() / 60
-        self._attr_native_value = ceil(state.runtime_remaining.total_seconds() / 60)
+        self._attr_native_max_value = state.maximum_runtime // ONE_MINUTE
+        # round up to the next whole minute
+        self._attr_native_value = -(-state.runtime_remaining // ONE_MINUTE)
+
+    def _state_signature(self) -> tuple[Any, ...]:
+        """Return the values that make up the entity state."""
+        return (self._attr_native_value, self._attr_native_max_value)
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new value."""
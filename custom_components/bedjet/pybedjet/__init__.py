@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Callable, Coroutine
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 import logging
-from math import ceil
+import struct
+from typing import Any
 
 from bleak import BleakGATTCharacteristic
 from bleak.backends.device import BLEDevice
@@ -36,6 +37,7 @@ BEDJET2_SERVICE_UUID = "49535343-fe7d-4ae5-8fa9-9fafd205e455"
 BEDJET2_STATUS_UUID = "49535343-1e4d-4bd9-ba61-23c647249616"
 BEDJET2_COMMAND_UUID = "49535343-8841-43f4-a8d4-ecbe34729bb3"
 BEDJET2_NOTIFICATION_LENGTH = 14
+BEDJET2_PACKET_HEADER = 0x58
 BEDJET2_TEMPERATURE_MIN_MAX = (19.0, 43.0)
 
 # BedJet 3 UUIDs
@@ -50,6 +52,22 @@ BEDJET3_BIODATA_FULL_UUID = "00002006-bed0-0080-aa55-4265644a6574"
 BEDJET3_NOTIFICATION_LENGTH = 20
 BEDJET3_STATUS_LENGTH = 11
 
+# BedJet 3 notification layout: 4 header bytes, remaining hours, minutes and
+# seconds, current and target temperature, operating mode, fan step, maximum
+# hours and minutes, minimum and maximum temperature, turbo time (big-endian
+# uint16), ambient temperature and shutdown reason
+BEDJET3_NOTIFICATION_STRUCT = struct.Struct(">4x11BH2B")
+
+# Characteristics resolved once per connection
+CHARACTERISTIC_UUIDS = (
+    BEDJET2_STATUS_UUID,
+    BEDJET2_COMMAND_UUID,
+    BEDJET3_STATUS_UUID,
+    BEDJET3_NAME_UUID,
+    BEDJET3_COMMAND_UUID,
+    BEDJET3_BIODATA_FULL_UUID,
+)
+
 CLIENT_CHARACTERISTIC_CONFIG = "00002902-0000-1000-8000-00805f9b34fb"
 
 DISCONNECT_DELAY = 60
@@ -63,10 +81,99 @@ OPERATING_MODE_BUTTON_MAP = {
     OperatingMode.DRY: BedJetButton.DRY,
 }
 
+BUTTON_COMMANDS = {
+    button: bytes((BedJetCommand.BUTTON, button)) for button in BedJetButton
+}
+OPERATING_MODE_COMMANDS = {
+    mode: BUTTON_COMMANDS[button] for mode, button in OPERATING_MODE_BUTTON_MAP.items()
+}
+
+# V2 Protocol: CMD_SET_SETTINGS (0x11) keyed by (muted, LED enabled)
+# Settings Byte: Bit 0 = Mute, Bit 1 = LED Off
+BEDJET2_SETTINGS_COMMANDS = {
+    (False, True): b"\x02\x11\x00",
+    (True, True): b"\x02\x11\x01",
+    (False, False): b"\x02\x11\x02",
+    (True, False): b"\x02\x11\x03",
+}
+
+# V2 Protocol: Button Events (0x02 0x01) keyed by operating mode
+# Pressing the button of the active mode toggles it off
+BEDJET2_MODE_BUTTON_COMMANDS = {
+    OperatingMode.TURBO: b"\x02\x01\x01",
+    OperatingMode.HEAT: b"\x02\x01\x02",
+    OperatingMode.COOL: b"\x02\x01\x03",
+}
+
+# V2 Protocol: Mode ID used by SET_FAN (0x07), unknown modes default to heat
+BEDJET2_MODE_IDS = {
+    OperatingMode.TURBO: 0x01,
+    OperatingMode.HEAT: 0x02,
+    OperatingMode.COOL: 0x03,
+}
+
+# GET_BIO commands keyed by (bio data request, tag)
+GET_BIO_COMMANDS = {
+    (request, tag): bytes((BedJetCommand.GET_BIO, request, tag))
+    for request in BioDataRequest
+    for tag in range(2)
+}
+
+# Operating modes keyed by value, for decoding notifications
+OPERATING_MODES = {mode.value: mode for mode in OperatingMode}
+
+# Device status notifications keyed by value, unknown values map to `None`
+BEDJET_NOTIFICATIONS = {
+    notification.value: notification for notification in BedJetNotification
+}
+
+BIO_DATA_READ_ATTEMPTS = 3
+BIO_DATA_READ_RETRY_DELAY = 0.05
+
+# Minimum seconds between callback dispatches unless the operating mode changes
+CALLBACK_MIN_INTERVAL = 0.25
+
 STALE_AFTER_SECONDS = 60
 
 
-@dataclass(frozen=True)
+def _build_bedjet2_mode_fan_table() -> tuple[tuple[OperatingMode, int], ...]:
+    """Build the BedJet V2 operating mode and fan speed lookup for byte 4."""
+    table = [(OperatingMode.STANDBY, 0)] * 256
+    for start, operating_mode in (
+        (33, OperatingMode.TURBO),  # 33-52 (0x21-0x34)
+        (65, OperatingMode.HEAT),  # 65-84
+        (97, OperatingMode.COOL),  # 97-116
+    ):
+        for step in range(20):
+            table[start + step] = (operating_mode, (step + 1) * 5)
+    return tuple(table)
+
+
+BEDJET2_MODE_FAN_TABLE = _build_bedjet2_mode_fan_table()
+
+
+def _reuse_timedelta(previous: timedelta, seconds: int) -> timedelta:
+    """Return `previous` if it equals `seconds`, otherwise a new timedelta."""
+    if previous.seconds == seconds and not previous.days:
+        return previous
+    return timedelta(seconds=seconds)
+
+
+async def _run_reads(*reads: Coroutine[Any, Any, None]) -> None:
+    """Run reads concurrently, cancelling the others if one fails.
+
+    The first failure is raised on its own so callers can keep catching the
+    original exception types.
+    """
+    try:
+        async with asyncio.TaskGroup() as group:
+            for read in reads:
+                group.create_task(read)
+    except BaseExceptionGroup as err:
+        raise err.exceptions[0] from None
+
+
+@dataclass(frozen=True, slots=True)
 class BedJetState:
     """BedJet state."""
 
@@ -87,30 +194,47 @@ class BedJetState:
 class BedJet:
     """BedJet class."""
 
-    _firmware_version: str | None = None
-    _biorhythm_names: list[str] | None = None
-    _memory_names: list[str] | None = None
-    _m1_name: str | None = None
-    _m2_name: str | None = None
-    _m3_name: str | None = None
-    _shutdown_reason: int | None = None
-
-    # status fields
-    _device_status_data: bytearray | None = None
-    _beeps_muted: bool | None = None
-    _bio_sequence_step: int | None = None
-    _connection_test_passed: bool | None = None
-    _dual_zone: bool | None = None
-    _led_enabled: bool | None = None
-    _notification: BedJetNotification | None = None
-    _units_setup: bool | None = None
-    _update_phase: int | None = None
-
-    # stale check
-    _last_update: datetime | None = None
-
-    # V2 Support Flag
-    _is_v2: bool = False
+    __slots__ = (
+        "_advertisement_data",
+        "_ambient_temperature_limiter",
+        "_auto_disconnect_timer",
+        "_beeps_muted",
+        "_bio_sequence_step",
+        "_biorhythm_labels",
+        "_biorhythm_names",
+        "_ble_device",
+        "_callbacks",
+        "_callbacks_fired_at",
+        "_callbacks_fired_mode",
+        "_callbacks_handle",
+        "_characteristics",
+        "_client",
+        "_connect_lock",
+        "_connection_test_passed",
+        "_current_temperature_limiter",
+        "_device_status_data",
+        "_dual_zone",
+        "_expected_disconnect",
+        "_firmware_version",
+        "_is_v2",
+        "_last_update",
+        "_led_enabled",
+        "_memory_labels",
+        "_memory_names",
+        "_name",
+        "_name_and_address",
+        "_notification",
+        "_operation_lock",
+        "_resolve_protocol_event",
+        "_run_end_time_limiter",
+        "_shutdown_reason",
+        "_state",
+        "_state_changed",
+        "_status_uuid",
+        "_units_setup",
+        "_update_phase",
+        "loop",
+    )
 
     def __init__(
         self, ble_device: BLEDevice, advertisement_data: AdvertisementData | None = None
@@ -123,11 +247,41 @@ class BedJet:
         self._connect_lock: asyncio.Lock = asyncio.Lock()
         self._auto_disconnect_timer: asyncio.TimerHandle | None = None
         self._client: BleakClientWithServiceCache | None = None
+        self._characteristics: dict[str, BleakGATTCharacteristic] = {}
+        self._status_uuid = BEDJET3_STATUS_UUID
         self._expected_disconnect = False
         self.loop = asyncio.get_running_loop()
-        self._callbacks: list[Callable[[BedJetState], None]] = []
+        self._callbacks: tuple[Callable[[BedJetState], None], ...] = ()
+        self._callbacks_handle: asyncio.Handle | None = None
+        self._callbacks_fired_at = float("-inf")
+        self._callbacks_fired_mode: OperatingMode | None = None
+        self._state_changed = asyncio.Event()
         self._resolve_protocol_event = asyncio.Event()
         self._name: str | None = None
+        self._name_and_address: str | None = None
+        self._firmware_version: str | None = None
+        self._biorhythm_labels: tuple[str | None, ...] = (None, None, None)
+        self._biorhythm_names: list[str] | None = None
+        self._memory_names: list[str] | None = None
+        self._memory_labels: tuple[str | None, ...] = (None, None, None)
+        self._shutdown_reason: int | None = None
+
+        # status fields
+        self._device_status_data: bytearray | None = None
+        self._beeps_muted: bool | None = None
+        self._bio_sequence_step: int | None = None
+        self._connection_test_passed: bool | None = None
+        self._dual_zone: bool | None = None
+        self._led_enabled: bool | None = None
+        self._notification: BedJetNotification | None = None
+        self._units_setup: bool | None = None
+        self._update_phase: int | None = None
+
+        # stale check (event loop time)
+        self._last_update: float | None = None
+
+        # V2 Support Flag
+        self._is_v2 = False
 
         # limiters
         self._current_temperature_limiter = TemperatureLimiter()
@@ -138,9 +292,12 @@ class BedJet:
         self, ble_device: BLEDevice, advertisement_data: AdvertisementData
     ) -> None:
         """Set the ble device."""
+        if ble_device.name != self._ble_device.name:
+            self._name_and_address = None
         self._ble_device = ble_device
         self._advertisement_data = advertisement_data
-        _LOGGER.debug("%s: RSSI=%s", self.name_and_address, self.rssi)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("%s: RSSI=%s", self.name_and_address, self.rssi)
 
     @property
     def address(self) -> str:
@@ -165,23 +322,17 @@ class BedJet:
     @property
     def biorhythm1_name(self) -> str | None:
         """Return the biorhythm 1 name."""
-        if self._biorhythm_names and (name := self._biorhythm_names[0]):
-            return name
-        return None
+        return self._biorhythm_labels[0]
 
     @property
     def biorhythm2_name(self) -> str | None:
         """Return the biorhythm 2 name."""
-        if self._biorhythm_names and (name := self._biorhythm_names[1]):
-            return name
-        return None
+        return self._biorhythm_labels[1]
 
     @property
     def biorhythm3_name(self) -> str | None:
         """Return the biorhythm 3 name."""
-        if self._biorhythm_names and (name := self._biorhythm_names[2]):
-            return name
-        return None
+        return self._biorhythm_labels[2]
 
     @property
     def bio_sequence_step(self) -> int | None:
@@ -208,8 +359,7 @@ class BedJet:
         """Return `True` if the data should be considered stale based on last update."""
         return (
             self._last_update is None
-            or (datetime.now(UTC) - self._last_update).total_seconds()
-            > STALE_AFTER_SECONDS
+            or self.loop.time() - self._last_update > STALE_AFTER_SECONDS
         )
 
     @property
@@ -220,23 +370,17 @@ class BedJet:
     @property
     def m1_name(self) -> str | None:
         """Return the M1 memory name."""
-        if self._memory_names and (name := self._memory_names[0]):
-            return f"M1: {name}"
-        return None
+        return self._memory_labels[0]
 
     @property
     def m2_name(self) -> str | None:
         """Return the M2 memory name."""
-        if self._memory_names and (name := self._memory_names[1]):
-            return f"M2: {name}"
-        return None
+        return self._memory_labels[1]
 
     @property
     def m3_name(self) -> str | None:
         """Return the M3 memory name."""
-        if self._memory_names and (name := self._memory_names[2]):
-            return f"M3: {name}"
-        return None
+        return self._memory_labels[2]
 
     @property
     def name(self) -> str:
@@ -246,7 +390,9 @@ class BedJet:
     @property
     def name_and_address(self) -> str:
         """Get the name and address of the device."""
-        return f"{self.name} ({self.address})"
+        if (name_and_address := self._name_and_address) is None:
+            name_and_address = self._name_and_address = f"{self.name} ({self.address})"
+        return name_and_address
 
     @property
     def notification(self) -> BedJetNotification | None:
@@ -286,136 +432,92 @@ class BedJet:
             raise ValueError(f"Invalid hour: {hour} (range is [0, 23])")
         if not 0 <= minute <= 59:
             raise ValueError(f"Invalid minute: {minute} (range is [0, 59])")
-        command = bytearray((BedJetCommand.SET_CLOCK, hour, minute))
+        command = bytes((BedJetCommand.SET_CLOCK, hour, minute))
         await self._send_command(command)
 
     async def set_fan_speed(self, fan_speed: int) -> None:
         """Set fan speed."""
+        if not 5 <= fan_speed <= 100:
+            raise ValueError(f"Invalid fan speed: {fan_speed} (range is [5, 100])")
         if self._is_v2:
             # V2 Protocol: SET_FAN (0x07)
             # Packet: 58 07 0E [MODE] [STEP] [TEMP] [HRS] [MIN] 00 [CHK]
 
+            state = self._state
+
             # 1. Determine Mode ID from current state
-            mode_id = 0x02  # Default Heat
-            if self.state.operating_mode == OperatingMode.TURBO:
-                mode_id = 0x01
-            elif self.state.operating_mode == OperatingMode.HEAT:
-                mode_id = 0x02
-            elif self.state.operating_mode == OperatingMode.COOL:
-                mode_id = 0x03
+            mode_id = BEDJET2_MODE_IDS.get(state.operating_mode, 0x02)
 
             # 2. Calculate Fan Step
-            step = int(fan_speed / 5)
+            step = fan_speed // 5
 
             # 3. Handle Timer Preservation
-            total_seconds = int(self.state.runtime_remaining.total_seconds())
-            hours = total_seconds // 3600
-            minutes = (total_seconds % 3600) // 60
+            hours, seconds = divmod(int(state.runtime_remaining.total_seconds()), 3600)
+            minutes = seconds // 60
 
             # 4. Handle Temperature and Mute Flag
-            temp_byte = round(self.state.target_temperature * 2)
+            temp_byte = round(state.target_temperature * 2)
 
             # If currently Muted, add 0x80 to bitmask to PRESERVE mute state
-            if self.beeps_muted:
+            if self._beeps_muted:
                 temp_byte |= 0x80
 
-            payload = bytearray(
-                [0x07, 0x0E, mode_id, step, temp_byte, hours, minutes, 0x00]
+            payload = bytes(
+                (0x07, 0x0E, mode_id, step, temp_byte, hours, minutes, 0x00)
             )
             await self._send_command(payload)
             return
 
         # Original V3 Command
-        command = bytearray((BedJetCommand.SET_FAN, int(fan_speed / 5) - 1))
+        command = bytes((BedJetCommand.SET_FAN, fan_speed // 5 - 1))
         await self._send_command(command)
 
     async def set_led(self, led: bool) -> None:
         """Set LED."""
         if self._is_v2:
-            # V2 Protocol: CMD_SET_SETTINGS (0x11)
-            # Settings Byte: Bit 0 = Mute, Bit 1 = LED Off
-            settings_byte = 0x00
-
             # Preserve current Mute state
-            if self.beeps_muted:
-                settings_byte |= 0x01
-
-            # Apply new LED state (Bit 1 is "Off")
-            if not led:
-                settings_byte |= 0x02
-
-            await self._send_command(bytearray([0x02, 0x11, settings_byte]))
+            muted = bool(self.beeps_muted)
+            await self._send_command(BEDJET2_SETTINGS_COMMANDS[(muted, led)])
             self._led_enabled = led
-            self._fire_callbacks()
+            self._schedule_callbacks()
             return
 
         # Original V3 Command
         button = BedJetButton.LED_ON if led else BedJetButton.LED_OFF
-        command = bytearray((BedJetCommand.BUTTON, button))
-        await self._send_command(command)
+        await self._send_command(BUTTON_COMMANDS[button])
         self._led_enabled = led
-        self._fire_callbacks()
+        self._schedule_callbacks()
 
     async def set_muted(self, muted: bool) -> None:
         """Set muted."""
         if self._is_v2:
-            # V2 Protocol: CMD_SET_SETTINGS (0x11)
-            # Settings Byte: Bit 0 = Mute, Bit 1 = LED Off
-            settings_byte = 0x00
-
-            # Apply new Mute state
-            if muted:
-                settings_byte |= 0x01
-
-            # Preserve current LED state (Bit 1 is "Off")
-            if self.led_enabled is False:
-                settings_byte |= 0x02
-
-            await self._send_command(bytearray([0x02, 0x11, settings_byte]))
+            # Preserve current LED state
+            led = self.led_enabled is not False
+            await self._send_command(BEDJET2_SETTINGS_COMMANDS[(muted, led)])
             self._beeps_muted = muted
-            self._fire_callbacks()
+            self._schedule_callbacks()
             return
 
         # Original V3 Command
         button = BedJetButton.MUTE if muted else BedJetButton.UNMUTE
-        command = bytearray((BedJetCommand.BUTTON, button))
-        await self._send_command(command)
+        await self._send_command(BUTTON_COMMANDS[button])
         self._beeps_muted = muted
-        self._fire_callbacks()
+        self._schedule_callbacks()
 
     async def set_operating_mode(self, operating_mode: OperatingMode) -> None:
         """Set operating mode."""
         if self._is_v2:
             # V2 Protocol: Button Events (0x02)
-            target_btn = None
-            if operating_mode == OperatingMode.TURBO:
-                target_btn = 0x01
-            elif operating_mode == OperatingMode.HEAT:
-                target_btn = 0x02
-            elif operating_mode == OperatingMode.COOL:
-                target_btn = 0x03
-            elif operating_mode != OperatingMode.STANDBY:
-                raise ValueError(f"Unsupported V2 operating mode: {operating_mode}")
+            current_mode = self._state.operating_mode
 
             # Handle OFF (Standby)
             if operating_mode == OperatingMode.STANDBY:
                 # Toggle current mode to turn off
-                curr = self.state.operating_mode
-                off_btn = None
-                if curr == OperatingMode.TURBO:
-                    off_btn = 0x01
-                elif curr == OperatingMode.HEAT:
-                    off_btn = 0x02
-                elif curr == OperatingMode.COOL:
-                    off_btn = 0x03
-
-                if off_btn:
-                    await self._send_command(bytearray([0x02, 0x01, off_btn]))
-                    try:
-                        async with asyncio.timeout(5):
-                            while self.state.operating_mode != OperatingMode.STANDBY:
-                                await asyncio.sleep(0.1)
-                    except TimeoutError:
+                if command := BEDJET2_MODE_BUTTON_COMMANDS.get(current_mode):
+                    await self._send_command(command)
+                    if not await self._wait_for_operating_mode(
+                        OperatingMode.STANDBY, 5
+                    ):
                         _LOGGER.warning(
                             "%s: Could not confirm V2 operating mode change in 5 seconds",
                             self.name_and_address,
@@ -423,36 +525,24 @@ class BedJet:
                 return
 
             # Handle ON (Mode Switch)
-            if target_btn:
-                # If already in mode, do nothing (unless it's Turbo, which we might want to refresh)
-                if (
-                    operating_mode != OperatingMode.TURBO
-                    and self.state.operating_mode == operating_mode
-                ):
-                    return
-
-                await self._send_command(bytearray([0x02, 0x01, target_btn]))
-                try:
-                    async with asyncio.timeout(5):
-                        while self.state.operating_mode != operating_mode:
-                            await asyncio.sleep(0.1)
-                except TimeoutError:
-                    _LOGGER.warning(
-                        "%s: Could not confirm V2 operating mode change in 5 seconds",
-                        self.name_and_address,
-                    )
+            if (command := BEDJET2_MODE_BUTTON_COMMANDS.get(operating_mode)) is None:
+                raise ValueError(f"Unsupported V2 operating mode: {operating_mode}")
+
+            # If already in mode, do nothing (unless it's Turbo, which we might want to refresh)
+            if operating_mode != OperatingMode.TURBO and current_mode == operating_mode:
+                return
+
+            await self._send_command(command)
+            if not await self._wait_for_operating_mode(operating_mode, 5):
+                _LOGGER.warning(
+                    "%s: Could not confirm V2 operating mode change in 5 seconds",
+                    self.name_and_address,
+                )
             return
 
         # Original V3 Command
-        command = bytearray(
-            (BedJetCommand.BUTTON, OPERATING_MODE_BUTTON_MAP[operating_mode])
-        )
-        await self._send_command(command)
-        try:
-            async with asyncio.timeout(1):
-                while self.state.operating_mode != operating_mode:
-                    await asyncio.sleep(0.1)
-        except TimeoutError:
+        await self._send_command(OPERATING_MODE_COMMANDS[operating_mode])
+        if not await self._wait_for_operating_mode(operating_mode, 1):
             _LOGGER.warning(
                 "%s: Could not confirm if operating mode was set in 1 second",
                 self.name_and_address,
@@ -470,11 +560,19 @@ class BedJet:
         if minutes >= 60:
             hours += int(minutes / 60)
             minutes = minutes % 60
-        command = bytearray((BedJetCommand.SET_RUNTIME, hours, minutes))
+        command = bytes((BedJetCommand.SET_RUNTIME, hours, minutes))
         await self._send_command(command)
 
     async def set_temperature(self, temperature: float) -> None:
         """Set temperature."""
+        state = self._state
+        if state.maximum_temperature and not (
+            state.minimum_temperature <= temperature <= state.maximum_temperature
+        ):
+            raise ValueError(
+                f"Invalid temperature: {temperature} (range is "
+                f"[{state.minimum_temperature}, {state.maximum_temperature}])"
+            )
         if self._is_v2:
             # V2 Protocol: CMD_SET_TEMP (0x02 0x07)
             temp_byte = round(temperature * 2)
@@ -483,11 +581,11 @@ class BedJet:
             if self.beeps_muted:
                 temp_byte |= 0x80
 
-            await self._send_command(bytearray([0x02, 0x07, temp_byte]))
+            await self._send_command(bytes((0x02, 0x07, temp_byte)))
             return
 
         # Original V3 Command
-        command = bytearray((BedJetCommand.SET_TEMPERATURE, round(temperature * 2)))
+        command = bytes((BedJetCommand.SET_TEMPERATURE, round(temperature * 2)))
         await self._send_command(command)
 
     async def update(self) -> None:
@@ -496,36 +594,95 @@ class BedJet:
         await self._ensure_connected()
 
         if not self._is_v2:
-            await self._read_device_status()
-            await self._read_memory_names()
-            await self._read_biorhythm_names()
+            await _run_reads(
+                self._read_device_status(),
+                self._read_memory_names(),
+                self._read_biorhythm_names(),
+            )
+
+        await self._wait_for_state(lambda state: state.current_temperature != 0, 5.0)
 
+    async def _wait_for_operating_mode(
+        self, operating_mode: OperatingMode, timeout: float
+    ) -> bool:
+        """Wait for the device to report an operating mode."""
+        return await self._wait_for_state(
+            lambda state: state.operating_mode == operating_mode, timeout
+        )
+
+    async def _wait_for_state(
+        self, predicate: Callable[[BedJetState], bool], timeout: float
+    ) -> bool:
+        """Wait for the state to match a predicate, returning `False` on timeout."""
         try:
-            async with asyncio.timeout(5.0):
-                while self._state.current_temperature == 0:
-                    await asyncio.sleep(0.1)
+            async with asyncio.timeout(timeout):
+                while not predicate(self._state):
+                    self._state_changed.clear()
+                    await self._state_changed.wait()
         except TimeoutError:
-            pass
+            return False
+        return True
 
     async def disconnect(self) -> None:
         """Disconnect from the BedJet."""
         _LOGGER.debug("%s: Disconnect", self.name_and_address)
         await self._execute_disconnect()
 
+    def _schedule_callbacks(self) -> None:
+        """Schedule the callbacks to fire once with the latest state.
+
+        Multiple state changes before the dispatch result in one dispatch of the
+        latest state. Dispatches are spaced at least `CALLBACK_MIN_INTERVAL` apart,
+        except for operating mode changes, which fire on the next event loop
+        iteration.
+        """
+        if self._state.operating_mode != self._callbacks_fired_mode:
+            delay = 0.0
+        else:
+            delay = self._callbacks_fired_at + CALLBACK_MIN_INTERVAL - self.loop.time()
+        if (handle := self._callbacks_handle) is not None:
+            if delay > 0 or not isinstance(handle, asyncio.TimerHandle):
+                return
+            handle.cancel()
+        if delay > 0:
+            self._callbacks_handle = self.loop.call_later(delay, self._fire_callbacks)
+        else:
+            self._callbacks_handle = self.loop.call_soon(self._fire_callbacks)
+
     def _fire_callbacks(self) -> None:
         """Fire the callbacks."""
+        self._callbacks_handle = None
+        state = self._state
+        self._callbacks_fired_at = self.loop.time()
+        self._callbacks_fired_mode = state.operating_mode
+        # callbacks are replaced rather than mutated, so they can unregister themselves
         for callback in self._callbacks:
-            callback(self._state)
+            # one failing listener must not stop the others or the dispatch
+            try:
+                callback(state)
+            except Exception:
+                _LOGGER.exception("%s: Error in callback", self.name_and_address)
 
     def register_callback(
         self, callback: Callable[[BedJetState], None]
     ) -> Callable[[], None]:
-        """Register a callback to be called when the state changes."""
+        """Register a callback to be called when the state changes.
+
+        The returned function removes this registration and is safe to call more
+        than once.
+        """
+        registered = True
 
         def unregister_callback() -> None:
-            self._callbacks.remove(callback)
+            nonlocal registered
+            if not registered:
+                return
+            registered = False
+            callbacks = list(self._callbacks)
+            callbacks.remove(callback)
+            self._callbacks = tuple(callbacks)
 
-        self._callbacks.append(callback)
+        self._callbacks = (*self._callbacks, callback)
         return unregister_callback
 
     async def _ensure_connected(self) -> None:
@@ -535,12 +692,12 @@ class BedJet:
                 "%s: Connection already in progress, waiting for it to complete",
                 self.name_and_address,
             )
-        if self._client and self._client.is_connected:
+        if self._connected_client():
             self._reset_disconnect_timer()
             return
         async with self._connect_lock:
             # Check again while holding the lock
-            if self._client and self._client.is_connected:
+            if self._connected_client():
                 self._reset_disconnect_timer()
                 return
             _LOGGER.debug("%s: Connecting", self.name_and_address)
@@ -557,10 +714,17 @@ class BedJet:
             self._client = client
             self._reset_disconnect_timer()
 
+            services = client.services
+            self._characteristics = {
+                uuid: char
+                for uuid in CHARACTERISTIC_UUIDS
+                if (char := services.get_characteristic(uuid))
+            }
+
             # V2 Protocol Detection
-            if client.services.get_characteristic(BEDJET2_STATUS_UUID):
+            if BEDJET2_STATUS_UUID in self._characteristics:
                 self._is_v2 = True
-                status_uuid = BEDJET2_STATUS_UUID
+                self._status_uuid = BEDJET2_STATUS_UUID
                 # V2 Init Packet (Wake Up)
                 await client.write_gatt_char(
                     BEDJET2_COMMAND_UUID,
@@ -570,14 +734,14 @@ class BedJet:
                 await asyncio.sleep(3.0)
             else:
                 self._is_v2 = False
-                status_uuid = BEDJET3_STATUS_UUID
+                self._status_uuid = BEDJET3_STATUS_UUID
 
             _LOGGER.debug("%s: Subscribe to notifications", self.name_and_address)
 
             for attempt in range(3):
                 try:
                     await client.start_notify(
-                        status_uuid,
+                        self._characteristic(self._status_uuid),
                         self._notification_handler,
                         cb={
                             "notification_discriminator": self._notification_check_handler
@@ -590,14 +754,19 @@ class BedJet:
                     await asyncio.sleep(1.0)
 
             if not self._is_v2:
+                # status and name use their own characteristics, so only the
+                # firmware request has to wait on other bio data requests
+                reads = []
                 if self._device_status_data is None:
-                    await self._read_device_status()
+                    reads.append(self._read_device_status())
                 if not self._name:
-                    await self._read_device_name()
+                    reads.append(self._read_device_name())
                 if not self._firmware_version:
-                    await self._read_device_firmware()
+                    reads.append(self._read_device_firmware())
+                await _run_reads(*reads)
             else:
                 self._name = "BedJet V2"
+                self._name_and_address = None
                 self._firmware_version = "ISSC V2"
 
     def _notification_check_handler(self, data: bytes) -> bool:
@@ -621,95 +790,108 @@ class BedJet:
 
         Temperatures are reported in degrees Celsius * 2.
         """
-        _LOGGER.debug(
-            "%s: Notification received: %s", self.name_and_address, data.hex()
-        )
-        self._last_update = _now = datetime.now(UTC)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s: Notification received: %s", self.name_and_address, data.hex()
+            )
+        self._last_update = self.loop.time()
+        _now = datetime.now(UTC)
 
         if self._is_v2:
             self._handle_v2_notification(data, _now)
             return
 
         if len(data) != BEDJET3_NOTIFICATION_LENGTH:
-            _LOGGER.debug(
-                "%s: Unexpected notification received: %s",
-                self.name_and_address,
-                data.hex(),
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "%s: Unexpected notification received: %s",
+                    self.name_and_address,
+                    data.hex(),
+                )
+            return
+
+        (
+            hours_remaining,
+            minutes_remaining,
+            seconds_remaining,
+            raw_current_temperature,
+            raw_target_temperature,
+            raw_operating_mode,
+            fan_step,
+            maximum_hours,
+            maximum_minutes,
+            raw_minimum_temperature,
+            raw_maximum_temperature,
+            turbo_time,
+            raw_ambient_temperature,
+            shutdown_reason,
+        ) = BEDJET3_NOTIFICATION_STRUCT.unpack_from(data)
+        if (operating_mode := OPERATING_MODES.get(raw_operating_mode)) is None:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "%s: Unknown operating mode %s in notification: %s",
+                    self.name_and_address,
+                    raw_operating_mode,
+                    data.hex(),
+                )
             return
 
-        hours_remaining = data[4]
-        minutes_remaining = data[5]
-        seconds_remaining = data[6]
         current_temperature = self._current_temperature_limiter.update(
-            self._decode_temperature(data[7]), _now
+            self._decode_temperature(raw_current_temperature), _now
         )
-        target_temperature = self._decode_temperature(data[8])
-        operating_mode = OperatingMode(data[9])
-        fan_step = data[10]
-        maximum_hours = data[11]
-        maximum_minutes = data[12]
-        minimum_temperature = self._decode_temperature(data[13])
-        maximum_temperature = self._decode_temperature(data[14])
-        turbo_time = int.from_bytes(data[15 : 15 + 2], byteorder="big")
+        target_temperature = self._decode_temperature(raw_target_temperature)
+        minimum_temperature = self._decode_temperature(raw_minimum_temperature)
+        maximum_temperature = self._decode_temperature(raw_maximum_temperature)
         ambient_temperature = self._ambient_temperature_limiter.update(
-            self._decode_temperature(data[17]), _now
+            self._decode_temperature(raw_ambient_temperature), _now
         )
-        self._shutdown_reason = data[18]
 
-        runtime_remaining = timedelta(
-            hours=hours_remaining, minutes=minutes_remaining, seconds=seconds_remaining
+        previous = self._state
+        runtime_remaining = _reuse_timedelta(
+            previous.runtime_remaining,
+            hours_remaining * 3600 + minutes_remaining * 60 + seconds_remaining,
         )
         run_end_time = self._run_end_time_limiter.update(runtime_remaining, _now)
-        maximum_runtime = timedelta(hours=maximum_hours, minutes=maximum_minutes)
+        maximum_runtime = _reuse_timedelta(
+            previous.maximum_runtime, maximum_hours * 3600 + maximum_minutes * 60
+        )
         fan_speed = (fan_step + 1) * 5
 
-        self._state = BedJetState(
+        state = BedJetState(
             current_temperature=current_temperature,
             target_temperature=target_temperature,
             operating_mode=operating_mode,
             runtime_remaining=runtime_remaining,
             run_end_time=run_end_time,
             maximum_runtime=maximum_runtime,
-            turbo_time=timedelta(seconds=turbo_time),
+            turbo_time=_reuse_timedelta(previous.turbo_time, turbo_time),
             fan_speed=fan_speed,
             minimum_temperature=minimum_temperature,
             maximum_temperature=maximum_temperature,
             ambient_temperature=ambient_temperature,
         )
+        if state == previous and shutdown_reason == self._shutdown_reason:
+            return
 
-        self._fire_callbacks()
+        self._state = state
+        self._state_changed.set()
+        self._shutdown_reason = shutdown_reason
+        self._schedule_callbacks()
 
     def _handle_v2_notification(self, data: bytearray, _now: datetime) -> None:
         """Handle ISSC V2 notification responses."""
         if len(data) != BEDJET2_NOTIFICATION_LENGTH:
-            _LOGGER.debug(
-                "%s: Unexpected notification received: %s",
-                self.name_and_address,
-                data.hex(),
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "%s: Unexpected notification received: %s",
+                    self.name_and_address,
+                    data.hex(),
+                )
             return
 
-        b4, b5 = data[4], data[5]
-        operating_mode = OperatingMode.STANDBY
-        fan_speed = 0
-
-        # Mode and fan detection
-        # COOL: 97-116
-        if 97 <= b4 <= 116:
-            operating_mode = OperatingMode.COOL
-            fan_speed = (b4 - 96) * 5
-        # HEAT: 65-84
-        elif 65 <= b4 <= 84:
-            operating_mode = OperatingMode.HEAT
-            fan_speed = (b4 - 64) * 5
-        # TURBO: 33-52 (0x21-0x34)
-        elif 33 <= b4 <= 52:
-            operating_mode = OperatingMode.TURBO
-            fan_speed = (b4 - 32) * 5
-        # OFF: 0x14 (20) or 0x0E (14) or Byte5=0
-        elif b4 == 0x14 or b4 == 0x0E or b5 == 0x00:
-            operating_mode = OperatingMode.STANDBY
+        b5 = data[5]
+        # Mode and fan detection, anything else (e.g. 0x14 or 0x0E) is off
+        operating_mode, fan_speed = BEDJET2_MODE_FAN_TABLE[data[4]]
 
         # Turbo fallback
         if b5 in (0x01, 0x02, 0x03, 0x04) and operating_mode == OperatingMode.STANDBY:
@@ -738,75 +920,112 @@ class BedJet:
         hours = b5 >> 4
         sub_raw = ((b5 & 0x0F) << 8) | data[6]
         total_seconds = hours * 3600 + (sub_raw * 60 + 32) // 64
-        runtime_remaining = timedelta(seconds=total_seconds)
+        previous = self._state
+        runtime_remaining = _reuse_timedelta(previous.runtime_remaining, total_seconds)
         run_end_time = self._run_end_time_limiter.update(runtime_remaining, _now)
         maximum_runtime = calculate_maximum_runtime(target_temperature, fan_speed)
 
         # Status flags (byte 8)
-        self._beeps_muted = bool(data[8] & 0x80)
-        self._led_enabled = not bool(data[3] & 0x80)
+        beeps_muted = bool(data[8] & 0x80)
+        led_enabled = not bool(data[3] & 0x80)
 
-        turbo_time = max(0, 600 - data[11])
+        turbo_time = _reuse_timedelta(previous.turbo_time, max(0, 600 - data[11]))
 
-        self._state = BedJetState(
+        state = BedJetState(
             current_temperature=current_temperature,
             target_temperature=target_temperature,
             operating_mode=operating_mode,
             runtime_remaining=runtime_remaining,
             run_end_time=run_end_time,
             maximum_runtime=maximum_runtime,
-            turbo_time=timedelta(seconds=turbo_time),
+            turbo_time=turbo_time,
             fan_speed=fan_speed,
             minimum_temperature=BEDJET2_TEMPERATURE_MIN_MAX[0],
             maximum_temperature=BEDJET2_TEMPERATURE_MIN_MAX[1],
             ambient_temperature=current_temperature,
         )
-        self._fire_callbacks()
+        if (
+            state == previous
+            and beeps_muted == self._beeps_muted
+            and led_enabled == self._led_enabled
+        ):
+            return
+
+        self._state = state
+        self._state_changed.set()
+        self._beeps_muted = beeps_muted
+        self._led_enabled = led_enabled
+        self._schedule_callbacks()
 
     def _parse_bio_data_response(self, data: bytearray) -> None:
         """Parse bio data responses."""
-        bio_type = data[0:1].hex()
-        tag = data[1:2].hex()
+        bio_type = data[0]
+        tag = data[1]
         message = "Unknown bio data"
+        changed = False
+
+        def parse_single(data: bytearray) -> str | None:
+            """Parse a single null-terminated text from a byte array."""
+            if data[0] == 0:
+                return "Default"
+            if data[0] == 1:
+                return None
+            return data.split(b"\x00", 1)[0].decode()
 
         def parse_text(
             data: bytearray, length: int | None = None, lead_bits: int = 0
-        ) -> str | list[str | list | None] | None:
+        ) -> str | list[str | None] | None:
             """Parse text from a byte array."""
             if lead_bits:
                 data = data[lead_bits:]
             if not length:
-                if data[0] == 0:
-                    return "Default"
-                if data[0] == 1:
-                    return None
-                return data.split(b"\x00", 1)[0].decode()
-            else:
-                count = range(ceil(len(data) / length))
-                return [parse_text(data[i * length : (i + 1) * length]) for i in count]
+                return parse_single(data)
+            count = range((len(data) + length - 1) // length)
+            return [parse_single(data[i * length : (i + 1) * length]) for i in count]
 
-        if bio_type == "00":
+        if bio_type == BioDataRequest.DEVICE_NAME:
             message = "Device name"
             self._name = parse_text(data, lead_bits=2)
-        elif bio_type == "01":
+            self._name_and_address = None
+        elif bio_type == BioDataRequest.MEMORY_NAMES:
             message = "Memory names"
-            self._memory_names = parse_text(data, 16, 2)
-        elif bio_type == "04":
+            names = self._memory_names = parse_text(data, 16, 2)
+            memory_labels = tuple(
+                f"M{index + 1}: {name}"
+                if index < len(names) and (name := names[index])
+                else None
+                for index in range(3)
+            )
+            changed = memory_labels != self._memory_labels
+            self._memory_labels = memory_labels
+        elif bio_type == BioDataRequest.BIORHYTHM_NAMES:
             message = "Biorhythm names"
-            self._biorhythm_names = parse_text(data, 16, 2)
-        elif bio_type == "20":
+            names = self._biorhythm_names = parse_text(data, 16, 2)
+            biorhythm_labels = tuple(
+                name if index < len(names) and (name := names[index]) else None
+                for index in range(3)
+            )
+            changed = biorhythm_labels != self._biorhythm_labels
+            self._biorhythm_labels = biorhythm_labels
+        elif bio_type == BioDataRequest.FIRMWARE_VERSIONS:
             message = "Firmware"
             firmwares = parse_text(data, 16, 2)
+            changed = firmwares[0] != self._firmware_version
             self._firmware_version = firmwares[0]
 
-        _LOGGER.debug(
-            "%s: %s (%s) received: %s (%s)",
-            self.name_and_address,
-            message,
-            tag,
-            data.hex(),
-            data,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s: %s (%02x) received: %s (%s)",
+                self.name_and_address,
+                message,
+                tag,
+                data.hex(),
+                data,
+            )
+
+        # names and firmware are not part of the state, so push them explicitly
+        if changed:
+            self._schedule_callbacks()
 
     def _reset_disconnect_timer(self) -> None:
         """Reset disconnect timer."""
@@ -822,21 +1041,18 @@ class BedJet:
         if self._expected_disconnect:
             _LOGGER.debug("%s: Disconnected from device", self.name_and_address)
             return
+        self._characteristics = {}
         _LOGGER.warning("%s: Device unexpectedly disconnected", self.name_and_address)
 
     def _auto_disconnect(self) -> None:
         """Disconnect from device automatically."""
         self._auto_disconnect_timer = None
-        asyncio.create_task(self._execute_timed_disconnect())
-
-    async def _execute_timed_disconnect(self) -> None:
-        """Execute timed disconnection."""
         _LOGGER.debug(
             "%s: Disconnecting after timeout of %s",
             self.name_and_address,
             DISCONNECT_DELAY,
         )
-        await self._execute_disconnect()
+        self.loop.create_task(self._execute_disconnect())
 
     async def _execute_disconnect(self) -> None:
         """Execute disconnection."""
@@ -846,10 +1062,10 @@ class BedJet:
             client = self._client
             self._expected_disconnect = True
             self._client = None
+            self._characteristics = {}
             if client and client.is_connected:
                 try:
-                    uuid = BEDJET2_STATUS_UUID if self._is_v2 else BEDJET3_STATUS_UUID
-                    await client.stop_notify(uuid)
+                    await client.stop_notify(self._status_uuid)
                 except BleakError:
                     _LOGGER.debug(
                         "%s: Failed to stop notifications",
@@ -860,138 +1076,164 @@ class BedJet:
 
     async def _read_device_name(self) -> None:
         """Read device name (BedJet 3 only)."""
-        if self._client and self._client.is_connected:
+        if client := self._connected_client():
             _LOGGER.debug("%s: Read device name", self.name_and_address)
-            data = await self._client.read_gatt_char(BEDJET3_NAME_UUID)
+            data = await client.read_gatt_char(self._characteristic(BEDJET3_NAME_UUID))
             if (name := data.decode()) != self.name:
                 _LOGGER.debug(
                     "%s: Actual device name is %s", self.name_and_address, name
                 )
                 self._name = name
+                self._name_and_address = None
 
     async def _read_device_status(self) -> None:
         """Read device status."""
-        if self._client and self._client.is_connected:
+        if client := self._connected_client():
             _LOGGER.debug("%s: Read device status", self.name_and_address)
-            data = await self._client.read_gatt_char(BEDJET3_STATUS_UUID)
-            self._last_update = datetime.now(UTC)
+            data = await client.read_gatt_char(
+                self._characteristic(BEDJET3_STATUS_UUID)
+            )
+            self._last_update = self.loop.time()
 
+            debug = _LOGGER.isEnabledFor(logging.DEBUG)
             if len(data) != BEDJET3_STATUS_LENGTH:
+                if debug:
+                    _LOGGER.debug(
+                        "%s: Unexpected device status received: %s",
+                        self.name_and_address,
+                        data.hex(),
+                    )
+                return
+
+            if debug:
                 _LOGGER.debug(
-                    "%s: Unexpected device status received: %s",
+                    "%s: Received device status: %s",
                     self.name_and_address,
                     data.hex(),
                 )
+            if (old_data := self._device_status_data) == data:
                 return
 
-            _LOGGER.debug(
-                "%s: Received device status: %s", self.name_and_address, data.hex()
-            )
-            if (old_data := self._device_status_data) != data:
+            if debug:
                 _LOGGER.debug(
                     "%s: Device status updated: %s -> %s",
                     self.name_and_address,
                     old_data.hex() if old_data else None,
                     data.hex(),
                 )
-                self._device_status_data = data
-                # _ = data[0]  # unknown
-                # _ = data[1]  # unknown
-                _, _, _, _, _, _, self._dual_zone, _ = [
-                    bool(data[2] >> x & 1) for x in range(7, -1, -1)
-                ]
-                # _ = data[3]  # unknown
-                # _ = data[4]  # unknown
-                # _ = data[5]  # unknown
-                self._update_phase = data[6]
-                (
-                    _,
-                    _,
-                    self._connection_test_passed,
-                    self._led_enabled,
-                    _,
-                    self._units_setup,
-                    _,
-                    self._beeps_muted,
-                ) = [bool(data[7] >> x & 1) for x in range(7, -1, -1)]
-                self._bio_sequence_step = data[8]
-                self._notification = BedJetNotification(data[9])
-                # _ = data[10]  # unknown
-
-                self._fire_callbacks()
+            self._device_status_data = data
+            # _ = data[0]  # unknown
+            # _ = data[1]  # unknown
+            self._dual_zone = bool(data[2] & 0x02)
+            # _ = data[3]  # unknown
+            # _ = data[4]  # unknown
+            # _ = data[5]  # unknown
+            self._update_phase = data[6]
+            flags = data[7]
+            self._connection_test_passed = bool(flags & 0x20)
+            self._led_enabled = bool(flags & 0x10)
+            self._units_setup = bool(flags & 0x04)
+            self._beeps_muted = bool(flags & 0x01)
+            self._bio_sequence_step = data[8]
+            self._notification = BEDJET_NOTIFICATIONS.get(data[9])
+            # _ = data[10]  # unknown
+
+            self._schedule_callbacks()
 
     async def _read_device_firmware(self) -> None:
         """Read device firmware."""
-        tag = 0
-        while not self._firmware_version and tag < 2:
-            if self._client and self._client.is_connected:
-                _LOGGER.debug("%s: Read device firmware", self.name_and_address)
-                command = bytearray(
-                    (BedJetCommand.GET_BIO, BioDataRequest.FIRMWARE_VERSIONS, tag)
-                )
-                await self._send_command(command)
-                data = await self._client.read_gatt_char(BEDJET3_BIODATA_FULL_UUID)
-                self._parse_bio_data_response(data)
-                tag += 1
-        if not self._firmware_version:
-            _LOGGER.debug("%s: Failed to read firmware", self.name_and_address)
+        await self._read_bio_data(
+            BioDataRequest.FIRMWARE_VERSIONS,
+            lambda: self._firmware_version,
+            "firmware",
+        )
 
     async def _read_biorhythm_names(self) -> None:
         """Read biorhythm preset names."""
-        tag = 0
-        while not self._biorhythm_names and tag < 2:
-            if self._client and self._client.is_connected:
-                _LOGGER.debug("%s: Read biorhythm names", self.name_and_address)
-                command = bytearray(
-                    (BedJetCommand.GET_BIO, BioDataRequest.BIORHYTHM_NAMES, tag)
-                )
-                await self._send_command(command)
-                data = await self._client.read_gatt_char(BEDJET3_BIODATA_FULL_UUID)
-                self._parse_bio_data_response(data)
-                tag += 1
-        if not self._biorhythm_names:
-            _LOGGER.debug("%s: Failed to read biorhythm names", self.name_and_address)
+        await self._read_bio_data(
+            BioDataRequest.BIORHYTHM_NAMES,
+            lambda: self._biorhythm_names,
+            "biorhythm names",
+        )
 
     async def _read_memory_names(self) -> None:
         """Read memory preset names."""
-        tag = 0
-        while not self._memory_names and tag < 2:
-            if self._client and self._client.is_connected:
-                _LOGGER.debug("%s: Read memory names", self.name_and_address)
-                command = bytearray(
-                    (BedJetCommand.GET_BIO, BioDataRequest.MEMORY_NAMES, tag)
+        await self._read_bio_data(
+            BioDataRequest.MEMORY_NAMES, lambda: self._memory_names, "memory names"
+        )
+
+    async def _read_bio_data(
+        self, request: BioDataRequest, result: Callable[[], Any], label: str
+    ) -> None:
+        """Request bio data until `result` returns a value or both tags were tried."""
+        for tag in range(2):
+            if result() or not (client := self._connected_client()):
+                break
+            _LOGGER.debug("%s: Read %s", self.name_and_address, label)
+            # bio data requests share one response characteristic
+            async with self._operation_lock:
+                # the response must be processed before reading it back
+                await self._send_command(
+                    GET_BIO_COMMANDS[(request, tag)], response=True
                 )
-                await self._send_command(command)
-                data = await self._client.read_gatt_char(BEDJET3_BIODATA_FULL_UUID)
-                self._parse_bio_data_response(data)
-                tag += 1
-        if not self._memory_names:
-            _LOGGER.debug("%s: Failed to read memory names", self.name_and_address)
+                for attempt in range(BIO_DATA_READ_ATTEMPTS):
+                    if attempt:
+                        await asyncio.sleep(BIO_DATA_READ_RETRY_DELAY)
+                    data = await client.read_gatt_char(
+                        self._characteristic(BEDJET3_BIODATA_FULL_UUID)
+                    )
+                    # re-read a stale response from a previous request
+                    if data and data[0] == request:
+                        break
+            self._parse_bio_data_response(data)
+        if not result():
+            _LOGGER.debug("%s: Failed to read %s", self.name_and_address, label)
+
+    def _characteristic(self, uuid: str) -> BleakGATTCharacteristic | str:
+        """Return the cached characteristic for a UUID, or the UUID if not cached."""
+        return self._characteristics.get(uuid, uuid)
+
+    def _connected_client(self) -> BleakClientWithServiceCache | None:
+        """Return the client if it is connected."""
+        if (client := self._client) and client.is_connected:
+            return client
+        return None
 
-    async def _send_command(self, command: bytearray) -> None:
-        """Send a command to the BedJet."""
-        if self._client and self._client.is_connected:
-            _LOGGER.debug(
-                "%s: Sending command: %s", self.name_and_address, command.hex()
-            )
+    async def _send_command(self, command: bytes, response: bool | None = None) -> None:
+        """Send a command to the BedJet.
+
+        BedJet 3 commands are written without response when the characteristic
+        supports it, unless `response` is specified.
+        """
+        if client := self._connected_client():
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "%s: Sending command: %s", self.name_and_address, command.hex()
+                )
 
             if self._is_v2:
                 # WRAPPER: 0x58 + CMD + CHECKSUM
-                v2_payload = bytearray([0x58]) + command
-                total = sum(v2_payload) & 0xFF
-                checksum = (0xFF - total) & 0xFF
-                v2_payload.append(checksum)
+                checksum = ~(BEDJET2_PACKET_HEADER + sum(command)) & 0xFF
+                v2_payload = bytes((BEDJET2_PACKET_HEADER, *command, checksum))
                 # Send V2 Packet
-                await self._client.write_gatt_char(
-                    BEDJET2_COMMAND_UUID, v2_payload, response=False
+                await client.write_gatt_char(
+                    self._characteristic(BEDJET2_COMMAND_UUID),
+                    v2_payload,
+                    response=False,
                 )
             else:
                 # Original V3 Command
-                await self._client.write_gatt_char(BEDJET3_COMMAND_UUID, command)
+                char = self._characteristic(BEDJET3_COMMAND_UUID)
+                if response is None:
+                    response = isinstance(char, str) or (
+                        "write-without-response" not in char.properties
+                    )
+                await client.write_gatt_char(char, command, response)
 
     async def _run_test_commands(self) -> None:
         """Run test commands (BedJet 3 only)."""
-        if self._client and self._client.is_connected and not self._is_v2:
+        if not self._is_v2 and (client := self._connected_client()):
+            debug = _LOGGER.isEnabledFor(logging.DEBUG)
             tag = 0
             for bio_type in (
                 BioDataRequest.BIORHYTHM_NAMES,
@@ -1001,22 +1243,24 @@ class BedJet:
             ):
                 tag += 1
                 command = bytearray((BedJetCommand.GET_BIO, bio_type, tag))
-                _LOGGER.debug(
-                    "%s: Writing command value: %s",
-                    self.name_and_address,
-                    command.hex(),
-                )
-                await self._client.write_gatt_char(BEDJET3_COMMAND_UUID, command, True)
+                if debug:
+                    _LOGGER.debug(
+                        "%s: Writing command value: %s",
+                        self.name_and_address,
+                        command.hex(),
+                    )
+                await client.write_gatt_char(BEDJET3_COMMAND_UUID, command, True)
 
-                data = await self._client.read_gatt_char(BEDJET3_BIODATA_FULL_UUID)
+                data = await client.read_gatt_char(BEDJET3_BIODATA_FULL_UUID)
                 self._parse_bio_data_response(data)
-                _LOGGER.debug(
-                    "%s: %s/%s, %s/%s, %s, %s",
-                    self.name_and_address,
-                    bio_type,
-                    data[0],
-                    tag,
-                    data[1],
-                    data[2:].hex(),
-                    data[2:],
-                )
+                if debug:
+                    _LOGGER.debug(
+                        "%s: %s/%s, %s/%s, %s, %s",
+                        self.name_and_address,
+                        bio_type,
+                        data[0],
+                        tag,
+                        data[1],
+                        data[2:].hex(),
+                        data[2:],
+                    )
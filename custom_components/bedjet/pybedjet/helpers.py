@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from datetime import timedelta
 
 # Table: (temperature_threshold, [(fan_limit, hours), ...])
@@ -17,15 +18,24 @@ RUNTIME_TABLE = [
     (float("inf"), [(20, 4), (40, 2), (100, 1)]),
 ]
 
+# Sorted thresholds and matching fan rules with prebuilt runtimes for lookups
+_TEMPERATURE_THRESHOLDS = tuple(threshold for threshold, _ in RUNTIME_TABLE)
+_FAN_RULES = tuple(
+    tuple((fan_limit, timedelta(hours=hours)) for fan_limit, hours in fan_rules)
+    for _, fan_rules in RUNTIME_TABLE
+)
+_DEFAULT_RUNTIME = timedelta(hours=1)
+
 
 def calculate_maximum_runtime(temperature: float, fan_percent: int) -> timedelta:
     """Return maximum runtime as timedelta based on temperature (°C) and fan percent.
 
     This is for BedJet V2 only as BedJet 3 returns the maximum runtime in notifications.
     """
-    for temperature_threshold, fan_rules in RUNTIME_TABLE:
-        if temperature <= temperature_threshold:
-            for fan_limit, hours in fan_rules:
-                if fan_percent <= fan_limit:
-                    return timedelta(hours=hours)
-    return timedelta(hours=1)
+    # first row whose threshold is at or above the temperature
+    index = bisect_left(_TEMPERATURE_THRESHOLDS, temperature)
+    if index < len(_FAN_RULES):
+        for fan_limit, runtime in _FAN_RULES[index]:
+            if fan_percent <= fan_limit:
+                return runtime
+    return _DEFAULT_RUNTIME
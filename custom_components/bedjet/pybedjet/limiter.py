@@ -10,7 +10,7 @@ DEFAULT_TEMPERATURE_TIME = timedelta(seconds=15)
 DEFAULT_DELTA_SECONDS = 5
 
 
-@dataclass
+@dataclass(slots=True)
 class TemperatureLimiter:
     """Limit how often a temperature value is allowed to change.
 
@@ -48,27 +48,23 @@ class TemperatureLimiter:
         if now is None:
             now = datetime.now(UTC)
 
-        def _accept() -> float:
+        previous = self.temperature
+        last_updated = self.last_updated
+        if (
+            previous is None
+            or last_updated is None
+            or previous == temperature  # reset timer to further reduce jitter
+            or abs(temperature - previous) >= self.min_delta
+            or (now - last_updated) >= self.min_time
+        ):
             self.temperature = temperature
             self.last_updated = now
             return temperature
 
-        if self.last_updated is None or self.temperature is None:
-            return _accept()
-
-        if self.temperature == temperature:
-            return _accept()  # reset timer to further reduce jitter
-
-        if (
-            abs(temperature - self.temperature) >= self.min_delta
-            or (now - self.last_updated) >= self.min_time
-        ):
-            return _accept()
-
-        return self.temperature
+        return previous
 
 
-@dataclass
+@dataclass(slots=True)
 class EndTimeLimiter:
     """Stabilize a calculated end time derived from remaining time.
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -36,14 +37,14 @@ SENSORS = (
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         translation_key="ambient_temperature",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda device: device.state.ambient_temperature,
+        value_fn=attrgetter("state.ambient_temperature"),
     ),
     BedJetSensorEntityDescription(
         key="bio_sequence_step",
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
         translation_key="bio_sequence_step",
-        value_fn=lambda device: device.bio_sequence_step,
+        value_fn=attrgetter("bio_sequence_step"),
     ),
     BedJetSensorEntityDescription(
         key="notification",
@@ -70,14 +71,14 @@ SENSORS = (
         key="run_end_time",
         device_class=SensorDeviceClass.TIMESTAMP,
         translation_key="run_end_time",
-        value_fn=lambda device: device.state.run_end_time,
+        value_fn=attrgetter("state.run_end_time"),
     ),
     BedJetSensorEntityDescription(
         key="shutdown_reason",
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
         translation_key="shutdown_reason",
-        value_fn=lambda device: device.shutdown_reason,
+        value_fn=attrgetter("shutdown_reason"),
     ),
     BedJetSensorEntityDescription(
         key="turbo_time",
@@ -94,7 +95,7 @@ SENSORS = (
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
         translation_key="update_phase",
-        value_fn=lambda device: device.update_phase,
+        value_fn=attrgetter("update_phase"),
     ),
 )
 
@@ -106,9 +107,12 @@ async def async_setup_entry(
 ) -> None:
     """Set up the sensor platform for BedJet."""
     data = entry.runtime_data
+    coordinator, device, title = data.coordinator, data.device, entry.title
     async_add_entities(
-        BedJetSensorEntity(data.coordinator, data.device, entry.title, descriptor)
-        for descriptor in SENSORS
+        [
+            BedJetSensorEntity(coordinator, device, title, descriptor)
+            for descriptor in SENSORS
+        ]
     )
 
 
@@ -133,3 +137,7 @@ class BedJetSensorEntity(BedJetEntity, SensorEntity):
     def _async_update_attrs(self) -> None:
         """Handle updating _attr values."""
         self._attr_native_value = self.entity_description.value_fn(self._device)
+
+    def _state_signature(self) -> tuple[Any, ...]:
+        """Return the values that make up the entity state."""
+        return (self._attr_native_value,)
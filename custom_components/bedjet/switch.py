@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
@@ -30,15 +31,15 @@ SWITCHES = (
         key="enable_led",
         entity_category=EntityCategory.CONFIG,
         translation_key="enable_led",
-        toggle_fn=lambda device, muted: device.set_led(muted),
-        value_fn=lambda device: device.led_enabled,
+        toggle_fn=BedJet.set_led,
+        value_fn=attrgetter("led_enabled"),
     ),
     BedJetSwitchEntityDescription(
         key="mute_beeps",
         entity_category=EntityCategory.CONFIG,
         translation_key="mute_beeps",
-        toggle_fn=lambda device, muted: device.set_muted(muted),
-        value_fn=lambda device: device.beeps_muted,
+        toggle_fn=BedJet.set_muted,
+        value_fn=attrgetter("beeps_muted"),
     ),
 )
 
@@ -50,9 +51,12 @@ async def async_setup_entry(
 ) -> None:
     """Set up the switch platform for BedJet."""
     data = entry.runtime_data
+    coordinator, device, title = data.coordinator, data.device, entry.title
     async_add_entities(
-        BedJetSwitchEntity(data.coordinator, data.device, entry.title, descriptor)
-        for descriptor in SWITCHES
+        [
+            BedJetSwitchEntity(coordinator, device, title, descriptor)
+            for descriptor in SWITCHES
+        ]
     )
 
 
@@ -78,6 +82,10 @@ class BedJetSwitchEntity(BedJetEntity, SwitchEntity):
         """Handle updating _attr values."""
         self._attr_is_on = self.entity_description.value_fn(self._device)
 
+    def _state_signature(self) -> tuple[Any, ...]:
+        """Return the values that make up the entity state."""
+        return (self._attr_is_on,)
+
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
         await self.entity_description.toggle_fn(self._device, False)